@@ -399,13 +399,14 @@ class _NormalizationMixIn:
     def autoscaleMinMax(self, data):
         """Autoscale using min/max
 
+        This implementation considers all finite values as valid.
+        Override this method for normalization restricting valid values.
+
         :param numpy.ndarray data:
         :returns: (vmin, vmax)
         :rtype: Tuple[float,float]
         """
-        data = data[self.isValid(data)]
-        if data.size == 0:
-            return None, None
+        # Single pass on the data, no need to filter with isValid
         result = min_max(data, min_positive=False, finite=True)
         return result.minimum, result.maximum
 
@@ -423,7 +424,9 @@ class _NormalizationMixIn:
         # Use [0, 1] as data range for normalization not using range
         normdata = self.apply(data, 0., 1.)
         if normdata.dtype.kind == 'f':  # Replaces inf by NaN
-            normdata[numpy.isfinite(normdata) == False] = numpy.nan
+            invalid = numpy.isfinite(normdata)
+            numpy.logical_not(invalid, out=invalid)
+            normdata[invalid] = numpy.nan  # normdata is a new array
         if normdata.size == 0:  # Fallback
             return None, None
 
@@ -449,8 +452,11 @@ class _LinearNormalizationMixIn(_NormalizationMixIn):
         :rtype: Tuple[float,float]
         """
         if data.dtype.kind == 'f':  # Replaces inf by NaN
-            data = numpy.array(data, copy=True)  # Work on a copy
-            data[numpy.isfinite(data) == False] = numpy.nan
+            invalid = numpy.isfinite(data)
+            numpy.logical_not(invalid, out=invalid)
+            if invalid.any():
+                data = numpy.array(data, copy=True)  # Work on a copy
+                data[invalid] = numpy.nan
         if data.size == 0:  # Fallback
             return None, None
         with warnings.catch_warnings():
@@ -497,6 +503,17 @@ class _SqrtNormalization(_colormap.SqrtNormalization, _NormalizationMixIn):
     def isValid(self, value):
         return value >= 0.
 
+    def autoscaleMinMax(self, data):
+        # Single pass on the data rather than filtering valid values
+        result = min_max(data, min_positive=True, finite=True)
+        if result.maximum is None or result.maximum < 0:  # No valid value
+            return None, None
+        if result.minimum >= 0:  # All finite values are valid
+            return result.minimum, result.maximum
+        # Min is 0 if present, otherwise the strictly positive min
+        vmin = 0 if numpy.any(data == 0) else result.min_positive
+        return vmin, result.maximum
+
 
 class _GammaNormalization(_colormap.PowerNormalization, _LinearNormalizationMixIn):
     """Gamma correction normalization:
@@ -659,12 +676,19 @@ class Colormap(qt.QObject):
             return numpy.array(self._colors, copy=True)
         else:
             nbColors = int(nbColors)
-            colormap = self.copy()
-            colormap.setNormalization(Colormap.LINEAR)
-            colormap.setVRange(vmin=0, vmax=nbColors - 1)
-            colors = colormap.applyToData(
-                numpy.arange(nbColors, dtype=numpy.int32))
-            return colors
+            if nbColors == len(self._colors):
+                # Regular sampling of the LUT is the LUT itself
+                return numpy.array(self._colors, copy=True)
+            # Same sampling as applying a linear colormap in [0, nbColors-1]
+            # to numpy.arange(nbColors), without copying the colormap
+            nbLutColors = len(self._colors)
+            if nbColors <= 1:
+                indices = numpy.zeros(max(nbColors, 0), dtype=numpy.int64)
+            else:
+                indices = numpy.arange(nbColors) * (nbLutColors / (nbColors - 1))
+                indices = numpy.clip(
+                    indices.astype(numpy.int64), 0, nbLutColors - 1)
+            return self._colors[indices]
 
     def getName(self):
         """Return the name of the colormap
@@ -925,8 +949,9 @@ class Colormap(qt.QObject):
             vmax = None
 
         if vmin is None or vmax is None:  # Handle autoscale
-            from .plot.items.core import ColormapMixIn  # avoid cyclic import
-            if isinstance(data, ColormapMixIn):
+            # Check for ColormapMixIn items without importing it per call
+            # (it cannot be imported at module level: cyclic import)
+            if hasattr(data, '_getColormapAutoscaleRange'):
                 min_, max_ = data._getColormapAutoscaleRange(self)
                 # Make sure min_, max_ are not None
                 min_ = normalizer.DEFAULT_RANGE[0] if min_ is None else min_
@@ -1148,7 +1173,8 @@ class Colormap(qt.QObject):
                 self.getAutoscaleMode() == other.getAutoscaleMode() and
                 self.getVMin() == other.getVMin() and
                 self.getVMax() == other.getVMax() and
-                numpy.array_equal(self.getColormapLUT(), other.getColormapLUT())
+                numpy.array_equal(self.getColormapLUT(copy=False),
+                                  other.getColormapLUT(copy=False))
                 )
 
     _SERIAL_VERSION = 3
@@ -36,6 +36,7 @@ import numpy
 
 from ._utils import ticklayout
 from .. import qt
+from ..utils.image import convertArrayToQImage
 from silx.gui import colors
 
 _logger = logging.getLogger(__name__)
@@ -125,16 +126,15 @@ class ColorBarWidget(qt.QWidget):
         """Connect to Plot signals"""
         plot = self.getPlot()
         if plot is not None and not self._isConnected:
-            activeImageLegend = plot.getActiveImage(just_legend=True)
-            activeScatterLegend = plot._getActiveItem(
-                kind='scatter', just_legend=True)
-            if activeImageLegend is None and activeScatterLegend is None:
-                # Show plot default colormap
-                self._syncWithDefaultColormap()
-            elif activeImageLegend is not None:  # Show active image colormap
-                self._activeImageChanged(None, activeImageLegend)
-            elif activeScatterLegend is not None:  # Show active scatter colormap
-                self._activeScatterChanged(None, activeScatterLegend)
+            activeImage = plot.getActiveImage()
+            if activeImage is not None:  # Show active image colormap
+                self._syncWithImage(activeImage)
+            else:
+                activeScatter = plot._getActiveItem(kind='scatter')
+                if activeScatter is not None:  # Show active scatter colormap
+                    self._syncWithScatter(activeScatter)
+                else:  # Show plot default colormap
+                    self._syncWithDefaultColormap()
 
             plot.sigActiveImageChanged.connect(self._activeImageChanged)
             plot.sigActiveScatterChanged.connect(self._activeScatterChanged)
@@ -169,11 +169,12 @@ class ColorBarWidget(qt.QWidget):
         self._data = data
         self.getColorScaleBar().setColormap(colormap=colormap,
                                             data=data)
-        if self._colormap is not None:
-            self._colormap.sigChanged.disconnect(self._colormapHasChanged)
-        self._colormap = colormap
-        if self._colormap is not None:
-            self._colormap.sigChanged.connect(self._colormapHasChanged)
+        if colormap is not self._colormap:
+            if self._colormap is not None:
+                self._colormap.sigChanged.disconnect(self._colormapHasChanged)
+            self._colormap = colormap
+            if self._colormap is not None:
+                self._colormap.sigChanged.connect(self._colormapHasChanged)
 
     def _colormapHasChanged(self):
         """handler of the Colormap.sigChanged signal
@@ -213,38 +214,46 @@ class ColorBarWidget(qt.QWidget):
             return
 
         if legend is None:  # No active scatter, display no colormap
-            self.setColormap(colormap=None)
-            return
-
-        # Sync with active scatter
-        scatter = plot._getActiveItem(kind='scatter')
-
-        self.setColormap(colormap=scatter.getColormap(),
-                         data=scatter)
+            self._syncWithScatter(None)
+        else:  # Sync with active scatter
+            self._syncWithScatter(plot._getActiveItem(kind='scatter'))
 
     def _activeImageChanged(self, previous, legend):
         """Handle plot active image changed"""
         plot = self.getPlot()
 
         if legend is None:  # No active image, try with active scatter
-            activeScatterLegend = plot._getActiveItem(
-                kind='scatter', just_legend=True)
             # No more active image, use active scatter if any
-            self._activeScatterChanged(None, activeScatterLegend)
+            self._syncWithScatter(plot._getActiveItem(kind='scatter'))
+        else:  # Sync with active image
+            self._syncWithImage(plot.getActiveImage())
+
+    def _syncWithScatter(self, scatter):
+        """Update colorbar according to a scatter item
+
+        :param Union[None,~silx.gui.plot.items.Scatter] scatter:
+            The scatter to display the colormap of, or None for no colormap
+        """
+        if scatter is None:
+            self.setColormap(colormap=None)
         else:
-            # Sync with active image
-            image = plot.getActiveImage()
+            self.setColormap(colormap=scatter.getColormap(), data=scatter)
+
+    def _syncWithImage(self, image):
+        """Update colorbar according to an image item
 
-            # RGB(A) image, display default colormap
-            array = image.getData(copy=False)
-            if array.ndim != 2:
-                self.setColormap(colormap=None)
-                return
+        :param ~silx.gui.plot.items.ImageBase image: The image to sync with
+        """
+        # RGB(A) image, display default colormap
+        array = image.getData(copy=False)
+        if array.ndim != 2:
+            self.setColormap(colormap=None)
+            return
 
-            # data image, sync with image colormap
-            # do we need the copy here : used in the case we are changing
-            # vmin and vmax but should have already be done by the plot
-            self.setColormap(colormap=image.getColormap(), data=image)
+        # data image, sync with image colormap
+        # do we need the copy here : used in the case we are changing
+        # vmin and vmax but should have already be done by the plot
+        self.setColormap(colormap=image.getColormap(), data=image)
 
     def _defaultColormapChanged(self, event):
         """Handle plot default colormap changed"""
@@ -278,8 +287,26 @@ class _VerticalLegend(qt.QLabel):
         :param parent: the Qt parent if any
         """
         qt.QLabel.__init__(self, text, parent)
-        self.setLayout(qt.QVBoxLayout())
-        self.layout().setContentsMargins(0, 0, 0, 0)
+        self._updateSize()
+
+    def setText(self, text):
+        """Set the legend and update the widget size accordingly
+
+        :param str text: the legend
+        """
+        qt.QLabel.setText(self, text)
+        self._updateSize()
+
+    def changeEvent(self, event):
+        if event.type() == qt.QEvent.FontChange:
+            self._updateSize()
+        qt.QLabel.changeEvent(self, event)
+
+    def _updateSize(self):
+        """Fit the widget size to the rotated text"""
+        fm = qt.QFontMetrics(self.font())
+        self.setFixedWidth(fm.height())
+        self.setMinimumHeight(fm.width(self.text()))
 
     def paintEvent(self, event):
         painter = qt.QPainter(self)
@@ -291,12 +318,6 @@ class _VerticalLegend(qt.QLabel):
 
         painter.drawText(newRect, qt.Qt.AlignHCenter, self.text())
 
-        fm = qt.QFontMetrics(self.font())
-        preferedHeight = fm.width(self.text())
-        preferedWidth = fm.height()
-        self.setFixedWidth(preferedWidth)
-        self.setMinimumHeight(preferedHeight)
-
 
 class ColorScaleBar(qt.QWidget):
     """This class is making the composition of a :class:`_ColorScale` and a
@@ -339,6 +360,9 @@ class ColorScaleBar(qt.QWidget):
         self.maxVal = None
         """Value set to the _maxLabel"""
 
+        self._rangeKey = None
+        """Range and normalization displayed by the tick bar and labels"""
+
         self.setLayout(qt.QGridLayout())
 
         # create the left side group (ColorScale)
@@ -409,19 +433,27 @@ class ColorScaleBar(qt.QWidget):
         :param Union[numpy.ndarray,~silx.gui.plot.items.Item] data:
             The data or item to display, needed if the colormap requires an autoscale
         """
-        self.colorScale.setColormap(colormap, data)
-
         if colormap is not None:
             vmin, vmax = colormap.getColormapRange(data)
             normalizer = colormap._getNormalizer()
+            rangeKey = (vmin,
+                        vmax,
+                        colormap.getNormalization(),
+                        colormap.getGammaNormalizationParameter())
         else:
             vmin, vmax = None, None
             normalizer = None
+            rangeKey = None, None, None, None
 
-        self.tickbar.update(vmin=vmin,
-                            vmax=vmax,
-                            normalizer=normalizer)
-        self._setMinMaxLabels(vmin, vmax)
+        self.colorScale._setColormapAndRange(colormap, vmin, vmax)
+
+        # Skip ticks and labels update if range and normalization are the same
+        if rangeKey != self._rangeKey:
+            self._rangeKey = rangeKey
+            self.tickbar.update(vmin=vmin,
+                                vmax=vmax,
+                                normalizer=normalizer)
+            self._setMinMaxLabels(vmin, vmax)
 
     def setMinMaxVisible(self, val=True):
         """Change visibility of the min label and the max label
@@ -514,13 +546,20 @@ class _ColorScale(qt.QWidget):
     def __init__(self, colormap, parent=None, margin=5, data=None):
         qt.QWidget.__init__(self, parent)
         self._colormap = None
+        self._normalizer = None
+        """Normalizer of the colormap"""
+        self._normMin = None
+        """Normalized lower bound of the colormap range"""
+        self._normRange = None
+        """Extent of the normalized colormap range"""
+        self._colorImage = None
+        """Vertical strip of the colormap colors as a QImage"""
+        self._colorImageKey = None
+        """Colormap name and LUT used to build :attr:`_colorImage`"""
         self.margin = margin
         self.setColormap(colormap, data)
 
-        self.setLayout(qt.QVBoxLayout())
         self.setSizePolicy(qt.QSizePolicy.Fixed, qt.QSizePolicy.Expanding)
-        # needed to get the mouse event without waiting for button click
-        self.setMouseTracking(True)
         self.setMargin(margin)
         self.setContentsMargins(0, 0, 0, 0)
 
@@ -534,15 +573,34 @@ class _ColorScale(qt.QWidget):
         :param Union[None,numpy.ndarray,~silx.gui.plot.items.ColormapMixin] data:
             Optional data for which to compute colormap range.
         """
+        if colormap is None:
+            vmin, vmax = None, None
+        else:
+            vmin, vmax = colormap.getColormapRange(data=data)
+        self._setColormapAndRange(colormap, vmin, vmax)
+
+    def _setColormapAndRange(self, colormap, vmin, vmax):
+        """Set the colormap to display with an already computed range
+
+        :param Union[None,Colormap] colormap: the colormap to set
+        :param Union[None,float] vmin: Lower bound of the colormap range
+        :param Union[None,float] vmax: Upper bound of the colormap range
+        """
         self._colormap = colormap
         self.setEnabled(colormap is not None)
 
         if colormap is None:
             self.vmin, self.vmax = None, None
+            self._normalizer = None
+            self._normMin, self._normRange = None, None
         else:
             assert colormap.getNormalization() in colors.Colormap.NORMALIZATIONS
-            self.vmin, self.vmax = self._colormap.getColormapRange(data=data)
-        self._updateColorGradient()
+            self.vmin, self.vmax = vmin, vmax
+            self._normalizer = colormap._getNormalizer()
+            normMin, normMax = self._normalizer.apply(
+                [self.vmin, self.vmax], self.vmin, self.vmax)
+            self._normMin, self._normRange = normMin, normMax - normMin
+        self._updateColorImage()
         self.update()
 
     def getColormap(self):
@@ -552,43 +610,52 @@ class _ColorScale(qt.QWidget):
         """
         return None if self._colormap is None else self._colormap
 
-    def _updateColorGradient(self):
-        """Compute the color gradient"""
+    def _updateColorImage(self):
+        """Compute the image of the colormap colors"""
         colormap = self.getColormap()
         if colormap is None:
             return
 
-        indices = numpy.linspace(0., 1., self._NB_CONTROL_POINTS)
-        colors = colormap.getNColors(nbColors=self._NB_CONTROL_POINTS)
-        self._gradient = qt.QLinearGradient(0, 1, 0, 0)
-        self._gradient.setCoordinateMode(qt.QGradient.StretchToDeviceMode)
-        self._gradient.setStops(
-            [(i, qt.QColor(*color)) for i, color in zip(indices, colors)]
-        )
+        # Only rebuild the image when the colors have changed
+        lut = colormap.getColormapLUT(copy=False)
+        key = colormap.getName(), None if lut is None else lut.tobytes()
+        if key == self._colorImageKey:
+            return
+        self._colorImageKey = key
+
+        # 1 pixel wide image with the highest value on top,
+        # scaled to the widget by Qt when painting
+        rgba = colormap.getNColors(nbColors=self._NB_CONTROL_POINTS)
+        self._colorImage = convertArrayToQImage(
+            rgba[::-1].reshape(self._NB_CONTROL_POINTS, 1, 4))
 
     def paintEvent(self, event):
         """"""
         painter = qt.QPainter(self)
+        rect = qt.QRect(0,
+                        self.margin,
+                        self.width() - 1,
+                        self.height() - 2 * self.margin - 1)
+
         if self.getColormap() is not None:
-            painter.setBrush(self._gradient)
+            painter.setRenderHint(qt.QPainter.SmoothPixmapTransform)
+            painter.drawImage(rect, self._colorImage)
             penColor = self.palette().color(qt.QPalette.Active,
                                             qt.QPalette.Foreground)
         else:
             penColor = self.palette().color(qt.QPalette.Disabled,
                                             qt.QPalette.Foreground)
         painter.setPen(penColor)
+        painter.drawRect(rect)
 
-        painter.drawRect(qt.QRect(
-            0,
-            self.margin,
-            self.width() - 1,
-            self.height() - 2 * self.margin - 1))
-
-    def mouseMoveEvent(self, event):
-        tooltip = str(self.getValueFromRelativePosition(
-            self._getRelativePosition(event.y())))
-        qt.QToolTip.showText(event.globalPos(), tooltip, self)
-        super(_ColorScale, self).mouseMoveEvent(event)
+    def event(self, event):
+        if event.type() == qt.QEvent.ToolTip:
+            # Compute the value only when a tooltip is requested
+            tooltip = str(self.getValueFromRelativePosition(
+                self._getRelativePosition(event.pos().y())))
+            qt.QToolTip.showText(event.globalPos(), tooltip, self)
+            return True
+        return super(_ColorScale, self).event(event)
 
     def _getRelativePosition(self, yPixel):
         """yPixel : pixel position into _ColorScale widget reference
@@ -603,16 +670,12 @@ class _ColorScale(qt.QWidget):
         :param value: float value in [0, 1]
         :return: the value in [colormap['vmin'], colormap['vmax']]
         """
-        colormap = self.getColormap()
-        if colormap is None:
+        if self.getColormap() is None:
             return
 
         value = numpy.clip(value, 0., 1.)
-        normalizer = colormap._getNormalizer()
-        normMin, normMax = normalizer.apply([self.vmin, self.vmax], self.vmin, self.vmax)
-
-        return normalizer.revert(
-            normMin + (normMax - normMin) * value, self.vmin, self.vmax)
+        return self._normalizer.revert(
+            self._normMin + self._normRange * value, self.vmin, self.vmax)
 
     def setMargin(self, margin):
         """Define the margin to fit with a TickBar object.
@@ -780,42 +843,59 @@ class _TickBar(qt.QWidget):
         font = painter.font()
         font.setPixelSize(_TickBar._FONT_SIZE)
         painter.setFont(font)
+        fm = qt.QFontMetrics(font)
 
         # paint ticks
-        for val in self.ticks:
-            self._paintTick(val, painter, majorTick=True)
+        for val, height in zip(self.ticks, self._getPixelHeights(self.ticks)):
+            self._paintTick(val, height, painter, fm, majorTick=True)
 
         # paint subticks
-        for val in self.subTicks:
-            self._paintTick(val, painter, majorTick=False)
+        for val, height in zip(self.subTicks,
+                               self._getPixelHeights(self.subTicks)):
+            self._paintTick(val, height, painter, fm, majorTick=False)
+
+    def _getPixelHeights(self, values):
+        """Return the vertical pixel positions of values in the widget
 
-    def _getRelativePosition(self, val):
-        """Return the relative position of val according to min and max value
+        :param numpy.ndarray values:
+        :rtype: List[int]
         """
-        if self._normalizer is None:
-            return 0.
-        normMin, normMax, normVal = self._normalizer.apply(
-            [self._vmin, self._vmax, val],
+        viewportHeight = self.rect().height() - self.margin * 2 - 1
+        heights = viewportHeight * self._getRelativePositions(values) + self.margin
+        return heights.astype(numpy.int64).tolist()
+
+    def _getRelativePositions(self, values):
+        """Return the relative positions of values according to min and max value
+
+        :param numpy.ndarray values:
+        :rtype: numpy.ndarray
+        """
+        values = numpy.array(values, copy=False, dtype=numpy.float64)
+        if self._normalizer is None or values.size == 0:
+            return numpy.zeros(values.shape)
+
+        normMin, normMax = self._normalizer.apply(
+            [self._vmin, self._vmax],
             self._vmin,
             self._vmax)
-
         if normMin == normMax:
-            return 0.
-        else:
-            return 1. - (normVal - normMin) / (normMax - normMin)
+            return numpy.zeros(values.shape)
+
+        normValues = self._normalizer.apply(values, self._vmin, self._vmax)
+        return 1. - (normValues - normMin) / (normMax - normMin)
 
-    def _paintTick(self, val, painter, majorTick=True):
+    def _paintTick(self, val, height, painter, fm, majorTick=True):
         """
 
+        :param float val: The value of the tick
+        :param int height: The vertical pixel position of the tick
+        :param QPainter painter:
+        :param QFontMetrics fm: The metrics of the painter font
         :param bool majorTick: if False will never draw text and will set a line
             with a smaller width
         """
-        fm = qt.QFontMetrics(painter.font())
-        viewportHeight = self.rect().height() - self.margin * 2 - 1
-        relativePos = self._getRelativePosition(val)
-        height = int(viewportHeight * relativePos + self.margin)
         lineWidth = _TickBar._LINE_WIDTH
-        if majorTick is False:
+        if not majorTick:
             lineWidth /= 2
 
         painter.drawLine(qt.QLine(int(self.width() - lineWidth),
@@ -823,7 +903,7 @@ class _TickBar(qt.QWidget):
                                   self.width(),
                                   height))
 
-        if self.displayValues and majorTick is True:
+        if self.displayValues and majorTick:
             painter.drawText(qt.QPoint(0, int(height + fm.height() / 2)),
                              self.form.format(val))
 
@@ -246,6 +246,8 @@ class _StatsROITable(_StatsWidgetBase, TableWidget):
         self.__region_edition_callback = {}
         """We need to keep trace of the roi signals connection because
         the roi emits the sigChanged during roi edition"""
+        self.__roiConnections = {}
+        """Key is roi, values is list of (signal, slot) connected"""
         self._items = {}
         self.setRowCount(0)
         self.setColumnCount(3)
@@ -442,9 +444,11 @@ class _StatsROITable(_StatsWidgetBase, TableWidget):
         sorting = self.isSortingEnabled()
         if sorting:
             self.setSortingEnabled(False)
-        yield
-        if sorting:
-            self.setSortingEnabled(sorting)
+        try:
+            yield
+        finally:
+            if sorting:
+                self.setSortingEnabled(sorting)
 
     def _itemToRow(self, item):
         """Find the row corresponding to a plot item
@@ -516,19 +520,23 @@ class _StatsROITable(_StatsWidgetBase, TableWidget):
         if item._roi not in self.__roiToItems:
             self.__roiToItems[item._roi] = set()
             # TODO: normalize also sig name
+            # Keep callbacks to disconnect them when unregistering the roi
+            updateCallback = functools.partial(self._updateAllStats, False, True)
             if isinstance(item._roi, RegionOfInterest):
                 # item connection within sigRegionChanged should only be
                 # stopped during the region edition
-                self.__region_edition_callback[item._roi] = functools.partial(
-                    self._updateAllStats, False, True)
-                item._roi.sigRegionChanged.connect(self.__region_edition_callback[item._roi])
-                item._roi.sigEditingStarted.connect(functools.partial(
-                    self._startFiltering, item._roi))
-                item._roi.sigEditingFinished.connect(functools.partial(
-                    self._endFiltering, item._roi))
+                self.__region_edition_callback[item._roi] = updateCallback
+                connections = [
+                    (item._roi.sigRegionChanged, updateCallback),
+                    (item._roi.sigEditingStarted, functools.partial(
+                        self._startFiltering, item._roi)),
+                    (item._roi.sigEditingFinished, functools.partial(
+                        self._endFiltering, item._roi))]
             else:
-                item._roi.sigChanged.connect(functools.partial(
-                    self._updateAllStats, False, True))
+                connections = [(item._roi.sigChanged, updateCallback)]
+            for signal, slot in connections:
+                signal.connect(slot)
+            self.__roiConnections[item._roi] = connections
         self.__roiToItems[item._roi].add(item)
 
     def _startFiltering(self, roi):
@@ -541,17 +549,12 @@ class _StatsROITable(_StatsWidgetBase, TableWidget):
     def unregisterROI(self, roi):
         if roi in self.__roiToItems:
             del self.__roiToItems[roi]
-            if isinstance(roi, RegionOfInterest):
-                roi.sigRegionEditionStarted.disconnect(functools.partial(
-                    self._startFiltering, roi))
-                roi.sigRegionEditionFinished.disconnect(functools.partial(
-                    self._startFiltering, roi))
+            self.__region_edition_callback.pop(roi, None)
+            for signal, slot in self.__roiConnections.pop(roi, ()):
                 try:
-                    roi.sigRegionChanged.disconnect(self._updateAllStats)
-                except:
-                    pass
-            else:
-                roi.sigChanged.disconnect(self._updateAllStats)
+                    signal.disconnect(slot)
+                except (TypeError, RuntimeError):
+                    pass  # sigRegionChanged is disconnected during edition
 
     def _plotItemChanged(self, event):
         """Handle modifications of the items.
@@ -33,10 +33,10 @@ __date__ = "24/07/2018"
 
 from collections import OrderedDict
 from contextlib import contextmanager
+import itertools
 import logging
 import weakref
 import functools
-import numpy
 import enum
 from silx.utils.proxy import docstring
 from silx.utils.enum import Enum as _Enum
@@ -146,9 +146,19 @@ class _PlotWidgetWrapper(_Wrapper):
     :param PlotWidget plot:
     """
 
+    _KIND_BY_TYPE = {
+        plotitems.Curve: 'curve',
+        plotitems.ImageData: 'image',
+        plotitems.Scatter: 'scatter',
+        plotitems.Histogram: 'histogram',
+    }
+    """Mapping of supported item classes to their kind"""
+
     def __init__(self, plot):
         assert isinstance(plot, PlotWidget)
         super(_PlotWidgetWrapper, self).__init__(plot)
+        self._limits = None
+        """Last notified (xRange, yRange, y2Range) plot limits"""
         plot.sigItemAdded.connect(self.sigItemAdded.emit)
         plot.sigItemAboutToBeRemoved.connect(self.sigItemRemoved.emit)
         plot.sigActiveCurveChanged.connect(self._activeCurveChanged)
@@ -176,6 +186,9 @@ class _PlotWidgetWrapper(_Wrapper):
     def _limitsChanged(self, event):
         """Handle change of plot area limits."""
         if event['event'] == 'limitsChanged':
+            limits = event['xdata'], event['ydata'], event['y2data']
+            if limits != self._limits:
+                self._limits = limits
                 self.sigVisibleDataChanged.emit()
 
     def getItems(self):
@@ -207,16 +220,11 @@ class _PlotWidgetWrapper(_Wrapper):
         return item.getName()
 
     def getKind(self, item):
-        if isinstance(item, plotitems.Curve):
-            return 'curve'
-        elif isinstance(item, plotitems.ImageData):
-            return 'image'
-        elif isinstance(item, plotitems.Scatter):
-            return 'scatter'
-        elif isinstance(item, plotitems.Histogram):
-            return 'histogram'
-        else:
-            return None
+        for klass in type(item).__mro__:
+            kind = self._KIND_BY_TYPE.get(klass)
+            if kind is not None:
+                return kind
+        return None
 
 
 class _SceneWidgetWrapper(_Wrapper):
@@ -423,7 +431,8 @@ class _StatsWidgetBase(object):
         connections = []  # List of (signal, slot) to connect/disconnect
         if self._statsOnVisibleData:
             connections.append(
-                (self._plotWrapper.sigVisibleDataChanged, self._updateAllStats))
+                (self._plotWrapper.sigVisibleDataChanged,
+                 self._visibleDataChanged))
 
         if self._displayOnlyActItem:
             connections.append(
@@ -462,6 +471,10 @@ class _StatsWidgetBase(object):
         """Update stats for all rows in the table"""
         raise NotImplementedError('Base class')
 
+    def _visibleDataChanged(self):
+        """Handle change of the visible data area of the plot"""
+        self._updateAllStats()
+
     def setDisplayOnlyActiveItem(self, displayOnlyActItem):
         """Toggle display off all items or only the active/selected one
 
@@ -566,11 +579,47 @@ class StatsTable(_StatsWidgetBase, TableWidget):
     _LEGEND_HEADER_DATA = 'legend'
     _KIND_HEADER_DATA = 'kind'
 
+    _STATS_INVARIANT_EVENTS = (
+        ItemChangedType.VISIBLE,
+        ItemChangedType.ZVALUE,
+        ItemChangedType.NAME,
+        ItemChangedType.HIGHLIGHTED,
+        ItemChangedType.EDITABLE,
+        ItemChangedType.SELECTABLE,
+    )
+    """Item changes which do not modify statistics values"""
+
+    _VISIBLE_DATA_UPDATE_DELAY = 50
+    """Delay in ms used to merge visible data area changes"""
+
+    _PENDING_STATS_CHUNK_SIZE = 10
+    """Number of offscreen rows updated at once when the event loop is idle"""
+
     sigUpdateModeChanged = qt.Signal(object)
     """Signal emitted when the update mode changed"""
 
     def __init__(self, parent=None, plot=None):
         TableWidget.__init__(self, parent)
+
+        self._statsCache = {}
+        """Store {plot item: (visible area, stats)}"""
+
+        self._tableItems = {}
+        """Store {plot item: {column name: QTableWidgetItem}}"""
+
+        self._visibleDataTimer = qt.QTimer(self)
+        self._visibleDataTimer.setSingleShot(True)
+        self._visibleDataTimer.setInterval(self._VISIBLE_DATA_UPDATE_DELAY)
+        self._visibleDataTimer.timeout.connect(self._updateAllStats)
+
+        self._pendingItems = set()
+        """Plot items whose displayed stats are outdated"""
+
+        self._pendingStatsTimer = qt.QTimer(self)
+        self._pendingStatsTimer.setSingleShot(True)
+        self._pendingStatsTimer.setInterval(0)
+        self._pendingStatsTimer.timeout.connect(self._updatePendingStats)
+
         _StatsWidgetBase.__init__(self, statsOnVisibleData=False,
                                   displayOnlyActItem=False)
 
@@ -591,7 +640,15 @@ class StatsTable(_StatsWidgetBase, TableWidget):
         headerItem.setData(qt.Qt.UserRole, self._KIND_HEADER_DATA)
         self.setHorizontalHeaderItem(1, headerItem)
 
+        horizontalHeader = self.horizontalHeader()
+        if hasattr(horizontalHeader, 'setSectionResizeMode'):  # Qt5
+            horizontalHeader.setSectionResizeMode(qt.QHeaderView.ResizeToContents)
+        else:  # Qt4
+            horizontalHeader.setResizeMode(qt.QHeaderView.ResizeToContents)
+
         self.setSortingEnabled(True)
+        self.verticalScrollBar().valueChanged.connect(
+            self._viewportRowsChanged)
         self.setPlot(plot)
 
     @contextmanager
@@ -603,9 +660,28 @@ class StatsTable(_StatsWidgetBase, TableWidget):
         sorting = self.isSortingEnabled()
         if sorting:
             self.setSortingEnabled(False)
-        yield
-        if sorting:
-            self.setSortingEnabled(sorting)
+        try:
+            yield
+        finally:
+            if sorting:
+                self.setSortingEnabled(sorting)
+
+    @contextmanager
+    def _bulkUpdate(self):
+        """Context manager that disables table sorting and repaint
+
+        To use when updating many rows, so that the table is sorted and
+        repainted once. Previous state is restored when leaving
+        """
+        updatesEnabled = self.updatesEnabled()
+        if updatesEnabled:
+            self.setUpdatesEnabled(False)
+        try:
+            with self._disableSorting():
+                yield
+        finally:
+            if updatesEnabled:
+                self.setUpdatesEnabled(True)
 
     def setStats(self, statsHandler):
         """Set which stats to display and the associated formatting.
@@ -626,12 +702,6 @@ class StatsTable(_StatsWidgetBase, TableWidget):
                 headerItem.setToolTip(stat.description)
             self.setHorizontalHeaderItem(2 + index, headerItem)
 
-        horizontalHeader = self.horizontalHeader()
-        if hasattr(horizontalHeader, 'setSectionResizeMode'):  # Qt5
-            horizontalHeader.setSectionResizeMode(qt.QHeaderView.ResizeToContents)
-        else:  # Qt4
-            horizontalHeader.setResizeMode(qt.QHeaderView.ResizeToContents)
-
         self._updateItemObserve()
 
     def setPlot(self, plot):
@@ -662,8 +732,9 @@ class StatsTable(_StatsWidgetBase, TableWidget):
             items = self._plotWrapper.getItems()
 
         # Add items to the plot
-        for item in items:
-            self._addItem(item)
+        with self._bulkUpdate():
+            for item in items:
+                self._addItem(item)
 
     def _updateCurrentItem(self, *args):
         """specific callback for the sigCurrentChanged and with the
@@ -673,18 +744,34 @@ class StatsTable(_StatsWidgetBase, TableWidget):
          If exists, update it only when we are in 'auto' mode"""
         if self.getUpdateMode() is UpdateMode.MANUAL:
             # when sigCurrentChanged is giving the current item
-            if len(args) > 0 and isinstance(args[0], (plotitems.Curve, plotitems.Histogram, plotitems.ImageData, plotitems.Scatter)):
+            if len(args) > 0 and self._plotWrapper.getKind(args[0]) is not None:
                 item = args[0]
                 tableItems = self._itemToTableItems(item)
                 # if the table does not exists yet
                 if len(tableItems) == 0:
-                    self._updateItemObserve()
+                    self._updateSelectedItems()
             else:
                 # in this case no current item
-                self._updateItemObserve(args)
+                self._updateSelectedItems()
         else:
             # auto mode
-            self._updateItemObserve(args)
+            self._updateSelectedItems()
+
+    def _updateSelectedItems(self):
+        """Update the table to display the selected items of the plot
+
+        Rows of items which remain selected are kept as is, only rows of
+        deselected items are removed and newly selected items are added.
+        """
+        selectedItems = self._plotWrapper.getSelectedItems()
+        selectedSet = set(selectedItems)  # For constant time lookup
+        with self._bulkUpdate():
+            for item in list(self._tableItems):
+                if item not in selectedSet:
+                    self._removeItem(item)
+            for item in selectedItems:
+                if item not in self._tableItems:
+                    self._addItem(item)
 
     def _plotCurrentChanged(self, current):
         """Handle change of current item and update selection in table
@@ -714,11 +801,10 @@ class StatsTable(_StatsWidgetBase, TableWidget):
         :return: The corresponding row index
         :rtype: Union[int,None]
         """
-        for row in range(self.rowCount()):
-            tableItem = self.item(row, 0)
-            if self._tableItemToItem(tableItem) == item:
-                return row
-        return None
+        tableItems = self._tableItems.get(item)
+        if tableItems is None:
+            return None
+        return next(iter(tableItems.values())).row()
 
     def _itemToTableItems(self, item):
         """Find all table items corresponding to a plot item
@@ -728,37 +814,29 @@ class StatsTable(_StatsWidgetBase, TableWidget):
             for the given plot item.
         :rtype: OrderedDict
         """
-        result = OrderedDict()
-        row = self._itemToRow(item)
-        if row is not None:
-            for column in range(self.columnCount()):
-                tableItem = self.item(row, column)
-                if self._tableItemToItem(tableItem) != item:
-                    _logger.error("Table item/plot item mismatch")
-                else:
-                    header = self.horizontalHeaderItem(column)
-                    name = header.data(qt.Qt.UserRole)
-                    result[name] = tableItem
-        return result
+        return OrderedDict(self._tableItems.get(item, ()))
 
     def _plotItemChanged(self, event):
         """Handle modifications of the items.
 
         :param event:
         """
+        item = self.sender()
+        if (event not in self._STATS_INVARIANT_EVENTS and
+                not self._skipPlotItemChangedEvent(event)):
+            self._statsCache.pop(item, None)
+
         if self.getUpdateMode() is UpdateMode.MANUAL:
             return
         if self._skipPlotItemChangedEvent(event) is True:
             return
         else:
-            item = self.sender()
             self._updateStats(item, data_changed=True)
             # deal with stat items visibility
             if event is ItemChangedType.VISIBLE:
-                if len(self._itemToTableItems(item).items()) > 0:
-                    item_0 = list(self._itemToTableItems(item).values())[0]
-                    row_index = item_0.row()
-                    self.setRowHidden(row_index, not item.isVisible())
+                row = self._itemToRow(item)
+                if row is not None:
+                    self.setRowHidden(row, not item.isVisible())
 
     def _addItem(self, item):
         """Add a plot item to the table
@@ -769,36 +847,36 @@ class StatsTable(_StatsWidgetBase, TableWidget):
         :returns: True if the item is added to the widget.
         :rtype: bool
         """
-        if self._itemToRow(item) is not None:
+        if item in self._tableItems:
             _logger.info("Item already present in the table")
             self._updateStats(item)
             return True
 
         kind = self._plotWrapper.getKind(item)
-        if kind not in statsmdl.BASIC_COMPATIBLE_KINDS:
+        if kind is None:
             _logger.info("Item has not a supported type: %s", item)
             return False
 
         # Prepare table items
-        tableItems = [
-            qt.QTableWidgetItem(),  # Legend
-            qt.QTableWidgetItem()]  # Kind
-
-        for column in range(2, self.columnCount()):
-            header = self.horizontalHeaderItem(column)
-            name = header.data(qt.Qt.UserRole)
+        tableItems = OrderedDict((
+            (self._LEGEND_HEADER_DATA, qt.QTableWidgetItem()),
+            (self._KIND_HEADER_DATA, qt.QTableWidgetItem())))
 
-            formatter = self._statsHandler.formatters[name]
+        # Stat columns are created by setStats in the handler's order
+        statsHandler = self.getStatsHandler()
+        stats = {} if statsHandler is None else statsHandler.stats
+        for name, stat in stats.items():
+            formatter = statsHandler.formatters[name]
             if formatter:
                 tableItem = formatter.tabWidgetItemClass()
             else:
                 tableItem = qt.QTableWidgetItem()
 
-            tooltip = self._statsHandler.stats[name].getToolTip(kind=kind)
+            tooltip = stat.getToolTip(kind=kind)
             if tooltip is not None:
                 tableItem.setToolTip(tooltip)
 
-            tableItems.append(tableItem)
+            tableItems[name] = tableItem
 
         # Disable sorting while adding table items
         with self._disableSorting():
@@ -807,11 +885,12 @@ class StatsTable(_StatsWidgetBase, TableWidget):
 
             # Add table items to the last row
             row = self.rowCount() - 1
-            for column, tableItem in enumerate(tableItems):
+            for column, tableItem in enumerate(tableItems.values()):
                 tableItem.setData(qt.Qt.UserRole, _Container(item))
                 tableItem.setFlags(
                     qt.Qt.ItemIsEnabled | qt.Qt.ItemIsSelectable)
                 self.setItem(row, column, tableItem)
+            self._tableItems[item] = tableItems
 
             # Update table items content
             self._updateStats(item, data_changed=True)
@@ -831,19 +910,23 @@ class StatsTable(_StatsWidgetBase, TableWidget):
         """
         row = self._itemToRow(item)
         if row is None:
-            kind = self._plotWrapper.getKind(item)
-            if kind in statsmdl.BASIC_COMPATIBLE_KINDS:
+            if self._plotWrapper.getKind(item) is not None:
                 _logger.error("Removing item that is not in table: %s", str(item))
             return
         item.sigItemChanged.disconnect(self._plotItemChanged)
+        self._statsCache.pop(item, None)
+        self._pendingItems.discard(item)
+        del self._tableItems[item]
         self.removeRow(row)
 
     def _removeAllItems(self):
         """Remove content of the table"""
-        for row in range(self.rowCount()):
-            tableItem = self.item(row, 0)
-            item = self._tableItemToItem(tableItem)
+        for item in self._tableItems:
             item.sigItemChanged.disconnect(self._plotItemChanged)
+        self._tableItems = {}
+        self._statsCache = {}
+        self._pendingItems.clear()
+        self._pendingStatsTimer.stop()
         self.clearContents()
         self.setRowCount(0)
 
@@ -856,38 +939,52 @@ class StatsTable(_StatsWidgetBase, TableWidget):
         """
         if item is None:
             return
+        self._pendingItems.discard(item)
         plot = self.getPlot()
         if plot is None:
             _logger.info("Plot not available")
             return
 
-        row = self._itemToRow(item)
-        if row is None:
+        tableItems = self._tableItems.get(item)
+        if tableItems is None:
             _logger.error("This item is not in the table: %s", str(item))
             return
 
         statsHandler = self.getStatsHandler()
         if statsHandler is not None:
-            stats = statsHandler.calculate(
-                item, plot, self._statsOnVisibleData,
-                data_changed=data_changed, roi_changed=roi_changed)
+            if self._statsOnVisibleData:
+                visibleArea = (plot.getXAxis().getLimits(),
+                               plot.getYAxis().getLimits())
+            else:
+                visibleArea = None
+
+            cached = self._statsCache.get(item)
+            if cached is not None and cached[0] == visibleArea:
+                stats = cached[1]
+            else:
+                stats = statsHandler.calculate(
+                    item, plot, self._statsOnVisibleData,
+                    data_changed=data_changed, roi_changed=roi_changed)
+                self._statsCache[item] = visibleArea, stats
         else:
             stats = {}
 
         with self._disableSorting():
-            for name, tableItem in self._itemToTableItems(item).items():
+            for name, tableItem in tableItems.items():
                 if name == self._LEGEND_HEADER_DATA:
                     text = self._plotWrapper.getLabel(item)
-                    tableItem.setText(text)
                 elif name == self._KIND_HEADER_DATA:
-                    tableItem.setText(self._plotWrapper.getKind(item))
+                    text = self._plotWrapper.getKind(item)
                 else:
                     value = stats.get(name)
                     if value is None:
                         _logger.error("Value not found for: %s", name)
-                        tableItem.setText('-')
+                        text = '-'
                     else:
-                        tableItem.setText(str(value))
+                        text = str(value)
+                # Avoid table updates when the displayed text is unchanged
+                if tableItem.text() != text:
+                    tableItem.setText(text)
 
     def _updateAllStats(self, is_request=False):
         """Update stats for all rows in the table
@@ -896,11 +993,67 @@ class StatsTable(_StatsWidgetBase, TableWidget):
         """
         if self.getUpdateMode() is UpdateMode.MANUAL and not is_request:
             return
-        with self._disableSorting():
-            for row in range(self.rowCount()):
-                tableItem = self.item(row, 0)
-                item = self._tableItemToItem(tableItem)
-                self._updateStats(item, data_changed=is_request)
+        self._visibleDataTimer.stop()
+        if is_request:
+            self._statsCache = {}
+            with self._bulkUpdate():
+                for item in self._tableItems:
+                    self._updateStats(item, data_changed=True)
+        else:
+            # Only rows in the viewport are updated now, others when idle
+            self._pendingItems.update(self._tableItems)
+            self._updatePendingStats()
+
+    def _viewportItems(self):
+        """Returns the plot items of the rows displayed in the viewport
+
+        :rtype: List
+        """
+        top = self.rowAt(0)
+        if top < 0:
+            return []
+        bottom = self.rowAt(self.viewport().height() - 1)
+        if bottom < 0:
+            bottom = self.rowCount() - 1
+
+        items = []
+        for row in range(top, bottom + 1):
+            tableItem = self.item(row, 0)
+            if tableItem is not None:
+                items.append(self._tableItemToItem(tableItem))
+        return items
+
+    def _updatePendingStats(self):
+        """Update outdated rows, starting with the ones in the viewport
+
+        Offscreen rows are updated by chunks when the event loop is idle.
+        """
+        if (self.getUpdateMode() is UpdateMode.MANUAL or
+                not self._pendingItems):
+            return
+
+        items = [item for item in self._viewportItems()
+                 if item in self._pendingItems]
+        if not items:
+            items = list(itertools.islice(
+                self._pendingItems, self._PENDING_STATS_CHUNK_SIZE))
+
+        with self._bulkUpdate():
+            for item in items:
+                self._updateStats(item)
+
+        if self._pendingItems:
+            self._pendingStatsTimer.start()
+
+    def _viewportRowsChanged(self):
+        """Handle scrolling by updating newly displayed outdated rows first"""
+        if (self.getUpdateMode() is not UpdateMode.MANUAL and
+                self._pendingItems):
+            self._pendingStatsTimer.start()
+
+    def _visibleDataChanged(self):
+        # Merge bursts of plot limits changes into a single update
+        self._visibleDataTimer.start()
 
     def _currentItemChanged(self, current, previous):
         """Handle change of selection in table and sync plot selection
@@ -936,6 +1089,10 @@ class StatsTable(_StatsWidgetBase, TableWidget):
             self.setSelectionMode(qt.QAbstractItemView.NoSelection)
 
     def _updateModeHasChanged(self):
+        if self._updateMode is UpdateMode.MANUAL:
+            # Rows are only updated on request from now on
+            self._pendingItems.clear()
+            self._pendingStatsTimer.stop()
         self.sigUpdateModeChanged.emit(self._updateMode)
 
 
@@ -1248,8 +1405,8 @@ DEFAULT_STATS = StatsHandler((
     (statsmdl.StatMax(), StatFormatter()),
     statsmdl.StatCoordMax(),
     statsmdl.StatCOM(),
-    (('mean', numpy.mean), StatFormatter()),
-    (('std', numpy.std), StatFormatter()),
+    (statsmdl.StatMean(), StatFormatter()),
+    (statsmdl.StatStd(), StatFormatter()),
 ))
 
 
@@ -1360,7 +1517,7 @@ class _BaseLineStatsWidget(_StatsWidgetBase, qt.QWidget):
             Set the statistics to be displayed and how to format them using
         """
         _StatsWidgetBase.setStats(self, statsHandler)
-        for statName, stat in list(self._statsHandler.stats.items()):
+        for statName, stat in self._statsHandler.stats.items():
             self._addItemForStatistic(stat)
         self._updateAllStats()
 
@@ -1370,17 +1527,23 @@ class _BaseLineStatsWidget(_StatsWidgetBase, qt.QWidget):
         if kind == self._item_kind:
             self._updateAllStats()
 
+    def _getSelectedItem(self):
+        """Returns the selected item of the displayed kind if any
+
+        :rtype: Union[object,None]
+        """
+        kind = self.getKind()
+        for item in self._plotWrapper.getSelectedItems():
+            if self._plotWrapper.getKind(item) == kind:
+                return item
+        return None
+
     def _updateAllStats(self):
         plot = self.getPlot()
         if plot is not None:
-            _items = self._plotWrapper.getSelectedItems()
-
-            def kind_filter(_item):
-                return self._plotWrapper.getKind(_item) == self.getKind()
-            items = list(filter(kind_filter, _items))
-            assert len(items) in (0, 1)
-            if len(items) == 1:
-                self._setItem(items[0])
+            item = self._getSelectedItem()
+            if item is not None:
+                self._setItem(item)
 
     def setKind(self, kind):
         """Change the kind of active item to display
@@ -1409,21 +1572,14 @@ class _BaseLineStatsWidget(_StatsWidgetBase, qt.QWidget):
                                                             plot,
                                                             self._statsOnVisibleData,
                                                             data_changed=data_changed)
-                for statName, statVal in list(statsValDict.items()):
+                for statName, statVal in statsValDict.items():
                     self._statQlineEdit[statName].setText(statVal)
 
     def _updateItemObserve(self, *argv):
         if self.getUpdateMode() is UpdateMode.MANUAL:
             return
         assert self._displayOnlyActItem
-        _items = self._plotWrapper.getSelectedItems()
-
-        def kind_filter(_item):
-            return self._plotWrapper.getKind(_item) == self.getKind()
-        items = list(filter(kind_filter, _items))
-        assert len(items) in (0, 1)
-        _item = items[0] if len(items) == 1 else None
-        self._setItem(_item, data_changed=True)
+        self._setItem(self._getSelectedItem(), data_changed=True)
 
     def _updateCurrentItem(self):
         self._updateItemObserve()
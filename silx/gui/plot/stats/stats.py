@@ -50,6 +50,20 @@ from ....utils.deprecation import deprecated
 logger = logging.getLogger(__name__)
 
 
+def _readOnly(array):
+    """Returns a read-only view of an item data array
+
+    Item data is not copied by the contexts: this prevents statistics from
+    modifying the data of the item in place.
+
+    :param numpy.ndarray array:
+    :rtype: numpy.ndarray
+    """
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
 class Stats(OrderedDict):
     """Class to define a set of statistic relative to a dataset
     (image, curve...).
@@ -90,7 +104,7 @@ class Stats(OrderedDict):
         res = {}
         context = self._getContext(item=item, plot=plot, onlimits=onlimits,
                                    roi=roi)
-        for statName, stat in list(self.items()):
+        for statName, stat in self.items():
             if context.kind not in stat.compatibleKinds:
                 logger.debug('kind %s not managed by statistic %s'
                              % (context.kind, stat.name))
@@ -180,6 +194,9 @@ class _StatsContext(object):
         """The array of data with limit filtering if any. Is a numpy.ma.array,
         meaning that it embed the mask applied by the roi if any"""
 
+        self._meanStd = None
+        """Cache of (mean, std) of values, reset by clipData"""
+
         self.axes = None
         """A list of array of position on each axis.
 
@@ -330,9 +347,10 @@ class _CurveContext(_ScatterCurveHistoMixInContext):
     def clipData(self, item, plot, onlimits, roi):
         self._checkContextInputs(item=item, plot=plot, onlimits=onlimits,
                                  roi=roi)
+        self._meanStd = None
         self.roi = roi
         self.onlimits = onlimits
-        xData, yData = item.getData(copy=True)[0:2]
+        xData, yData = map(_readOnly, item.getData(copy=False)[0:2])
 
         if onlimits:
             minX, maxX = plot.getXAxis().getLimits()
@@ -394,7 +412,9 @@ class _HistogramContext(_ScatterCurveHistoMixInContext):
     def clipData(self, item, plot, onlimits, roi):
         self._checkContextInputs(item=item, plot=plot, onlimits=onlimits,
                                  roi=roi)
-        yData, edges = item.getData(copy=True)[0:2]
+        self._meanStd = None
+        yData, edges = item.getData(copy=False)[0:2]
+        yData = _readOnly(yData)
         xData = item._revertComputeEdges(x=edges, histogramType=item.getAlignment())
 
         if onlimits:
@@ -462,22 +482,22 @@ class _ScatterContext(_ScatterCurveHistoMixInContext):
     def clipData(self, item, plot, onlimits, roi):
         self._checkContextInputs(item=item, plot=plot, onlimits=onlimits,
                                  roi=roi)
-        valueData = item.getValueData(copy=True)
-        xData = item.getXData(copy=True)
-        yData = item.getYData(copy=True)
+        self._meanStd = None
+        valueData = _readOnly(item.getValueData(copy=False))
+        xData = _readOnly(item.getXData(copy=False))
+        yData = _readOnly(item.getYData(copy=False))
 
         if onlimits:
             minX, maxX = plot.getXAxis().getLimits()
             minY, maxY = plot.getYAxis().getLimits()
 
-            # filter on X axis
-            valueData = valueData[(minX <= xData) & (xData <= maxX)]
-            yData = yData[(minX <= xData) & (xData <= maxX)]
-            xData = xData[(minX <= xData) & (xData <= maxX)]
-            # filter on Y axis
-            valueData = valueData[(minY <= yData) & (yData <= maxY)]
-            xData = xData[(minY <= yData) & (yData <= maxY)]
-            yData = yData[(minY <= yData) & (yData <= maxY)]
+            # filter on X and Y axes with a single mask
+            visible = (minX <= xData) & (xData <= maxX)
+            visible &= minY <= yData
+            visible &= yData <= maxY
+            valueData = valueData[visible]
+            xData = xData[visible]
+            yData = yData[visible]
 
         if roi:
             if self.is_mask_valid(onlimits=onlimits, from_=roi.getFrom(),
@@ -556,10 +576,11 @@ class _ImageContext(_StatsContext):
     def clipData(self, item, plot, onlimits, roi):
         self._checkContextInputs(item=item, plot=plot, onlimits=onlimits,
                                  roi=roi)
+        self._meanStd = None
         self.origin = item.getOrigin()
         self.scale = item.getScale()
 
-        self.data = item.getData(copy=True)
+        self.data = _readOnly(item.getData(copy=False))
         mask = numpy.zeros_like(self.data)
         """mask use to know of the stat should be count in or not"""
 
@@ -642,6 +663,7 @@ class _plot3DScatterContext(_StatsContext):
     def clipData(self, item, plot, onlimits, roi):
         self._checkContextInputs(item=item, plot=plot, onlimits=onlimits,
                                  roi=roi)
+        self._meanStd = None
         if onlimits:
             raise RuntimeError("Unsupported plot %s" % str(plot))
         values = item.getValueData(copy=False)
@@ -652,11 +674,11 @@ class _plot3DScatterContext(_StatsContext):
             mask = numpy.zeros_like(values)
 
         if values is not None and len(values) > 0:
-            self.values = values
+            self.values = _readOnly(values)
             axes = [item.getXData(copy=False), item.getYData(copy=False)]
             if self.values.ndim == 3:
                 axes.append(item.getZData(copy=False))
-            self.axes = tuple(axes)
+            self.axes = tuple(_readOnly(axis) for axis in axes)
             self.min, self.max = min_max(self.values)
             self.values = numpy.ma.array(self.values, mask=mask)
         else:
@@ -694,6 +716,7 @@ class _plot3DArrayContext(_StatsContext):
     def clipData(self, item, plot, onlimits, roi):
         self._checkContextInputs(item=item, plot=plot, onlimits=onlimits,
                                  roi=roi)
+        self._meanStd = None
         if onlimits:
             raise RuntimeError("Unsupported plot %s" % str(plot))
 
@@ -705,7 +728,7 @@ class _plot3DArrayContext(_StatsContext):
             mask = numpy.zeros_like(values)
 
         if values is not None and len(values) > 0:
-            self.values = values
+            self.values = _readOnly(values)
             self.axes = tuple([numpy.arange(size) for size in self.values.shape])
             self.min, self.max = min_max(self.values)
             self.values = numpy.ma.array(self.values, mask=mask)
@@ -814,6 +837,53 @@ class StatDelta(StatBase):
         return context.max - context.min
 
 
+def _getMeanAndStd(context):
+    """Returns the mean and standard deviation of the context values
+
+    The result is stored in the context, so that mean is computed once for
+    both :class:`StatMean` and :class:`StatStd`.
+
+    :param _StatsContext context:
+    :rtype: Tuple[float,float]
+    """
+    if context._meanStd is None:
+        values = context.values
+        if not numpy.ma.is_masked(values):
+            # Work on the data array to avoid masked array overhead
+            values = numpy.ma.getdata(values)
+        mean = values.mean()
+        anomaly = values - mean
+        anomaly *= anomaly
+        std = numpy.sqrt(anomaly.mean())
+        context._meanStd = mean, std
+    return context._meanStd
+
+
+class StatMean(StatBase):
+    """Compute the mean value of the data"""
+    def __init__(self):
+        StatBase.__init__(self, name='mean')
+
+    @docstring(StatBase)
+    def calculate(self, context):
+        if context.values is None:
+            return None
+        return _getMeanAndStd(context)[0]
+
+
+class StatStd(StatBase):
+    """Compute the standard deviation of the data"""
+    def __init__(self):
+        StatBase.__init__(self, name='std',
+                          description='Standard deviation')
+
+    @docstring(StatBase)
+    def calculate(self, context):
+        if context.values is None:
+            return None
+        return _getMeanAndStd(context)[1]
+
+
 class _StatCoord(StatBase):
     """Base class for argmin and argmax stats"""
 
@@ -888,18 +958,26 @@ class StatCOM(StatBase):
             return None
 
         values = numpy.ma.array(context.values, mask=context.mask, dtype=numpy.float64)
-        sum_ = numpy.sum(values)
-        if sum_ == 0.:
-            return (numpy.nan,) * len(context.axes)
 
         if context.isStructuredData():
-            centerofmass = []
-            for index, axis in enumerate(context.axes):
+            # Reduce the data to its projection on each axis and get the sum
+            # from a projection rather than from another pass on the data
+            projections = []
+            for index in range(len(context.axes)):
                 axes = tuple([i for i in range(len(context.axes)) if i != index])
-                centerofmass.append(
-                    numpy.sum(axis * numpy.sum(values, axis=axes)) / sum_)
+                projections.append(numpy.sum(values, axis=axes))
+            sum_ = numpy.sum(projections[0])
+            if sum_ == 0.:
+                return (numpy.nan,) * len(context.axes)
+
+            centerofmass = []
+            for axis, projection in zip(context.axes, projections):
+                centerofmass.append(numpy.sum(axis * projection) / sum_)
             return tuple(reversed(centerofmass))
         else:
+            sum_ = numpy.sum(values)
+            if sum_ == 0.:
+                return (numpy.nan,) * len(context.axes)
             return tuple(
                 numpy.sum(axis * values) / sum_ for axis in context.axes)
 
@@ -173,9 +173,8 @@ class StatsHandler(object):
                 return str(val)
             else:
                 if isinstance(val, (tuple, list)):
-                    res = []
-                    [res.append(self.formatters[name].format(_val)) for _val in val]
-                    return ', '.join(res)
+                    formatter = self.formatters[name]
+                    return ', '.join(formatter.format(_val) for _val in val)
                 else:
                     return self.formatters[name].format(val)
 
@@ -197,6 +196,6 @@ class StatsHandler(object):
         """
         res = self.stats.calculate(item, plot, onlimits, roi,
                                    data_changed=data_changed, roi_changed=roi_changed)
-        for resName, resValue in list(res.items()):
-            res[resName] = self.format(resName, res[resName])
+        for resName, resValue in res.items():
+            res[resName] = self.format(resName, resValue)
         return res
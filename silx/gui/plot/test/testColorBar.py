@@ -275,6 +275,21 @@ class TestColorBarWidget(TestCaseQt):
                             vmax=1.0)
         self.colorBar.setColormap(colormap)
 
+    def testColormapRangeFromArray(self):
+        """Test the colormap range computed from an array is kept up-to-date"""
+        colormap = Colormap(name='gray',
+                            normalization=Colormap.LINEAR,
+                            vmin=None,
+                            vmax=None)
+        data = numpy.arange(9).reshape(3, 3)
+        scaleBar = self.colorBar.getColorScaleBar()
+
+        self.colorBar.setColormap(colormap, data=data)
+        self.assertEqual((scaleBar.minVal, scaleBar.maxVal), (0, 8))
+
+        colormap.setNormalization(Colormap.LOGARITHM)
+        self.assertEqual((scaleBar.minVal, scaleBar.maxVal), (1, 8))
+
 
 class TestColorBarUpdate(TestCaseQt):
     """Test that the ColorBar is correctly updated when the signal 'sigChanged'
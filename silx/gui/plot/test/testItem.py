@@ -328,10 +328,33 @@ class TestVisibleExtent(PlotWidgetTestCase):
         self.assertEqual(listener.callCount(), 5)
 
 
+class TestColormapAutoscaleRange(PlotWidgetTestCase):
+    """Test autoscale range of items with a colormap"""
+
+    def testMinMax(self):
+        """Test min/max autoscale range with linear and log normalizations"""
+        image = items.ImageData()
+        image.setData(numpy.array(((numpy.nan, -1., 0.),
+                                   (2., numpy.inf, 5.)), dtype=numpy.float32))
+        colormap = image.getColormap()
+        colormap.setVRange(None, None)
+
+        colormap.setNormalization(colormap.LOGARITHM)
+        self.assertEqual(colormap.getColormapRange(image), (2., 5.))
+
+        colormap.setNormalization(colormap.LINEAR)
+        self.assertEqual(colormap.getColormapRange(image), (-1., 5.))
+
+        # No valid data
+        image.setData(numpy.full((2, 2), numpy.nan))
+        self.assertEqual(colormap.getColormapRange(image), (0., 1.))
+
+
 def suite():
     test_suite = unittest.TestSuite()
     loadTests = unittest.defaultTestLoader.loadTestsFromTestCase
-    for klass in (TestSigItemChangedSignal, TestSymbol, TestVisibleExtent):
+    for klass in (TestSigItemChangedSignal, TestSymbol, TestVisibleExtent,
+                  TestColormapAutoscaleRange):
         test_suite.addTest(loadTests(klass))
     return test_suite
 
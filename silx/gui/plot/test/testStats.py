@@ -41,6 +41,7 @@ from silx.gui.plot.tools.roi import  RegionOfInterestManager
 from silx.gui.plot.stats.stats import Stats
 from silx.gui.plot.CurvesROIWidget import ROI
 from silx.utils.testutils import ParametricTestCase
+from silx.test.utils import test_options
 import unittest
 import logging
 import numpy
@@ -163,6 +164,59 @@ class TestStats(TestStatsBase, TestCaseQt):
 
         self.assertEqual(_stats['com'].calculate(self.imageContext), (xcom, ycom))
 
+    def testMeanStd(self):
+        """Test StatMean and StatStd against numpy.mean and numpy.std"""
+        for context in (self.curveContext,
+                        self.imageContext,
+                        self.scatterContext):
+            with self.subTest(kind=context.kind):
+                self.assertAlmostEqual(
+                    stats.StatMean().calculate(context),
+                    numpy.mean(context.values))
+                self.assertAlmostEqual(
+                    stats.StatStd().calculate(context),
+                    numpy.std(context.values))
+
+    def testReadOnlyValues(self):
+        """Test that statistics cannot modify the data of items"""
+        def inplace(data):
+            data.sort()
+
+        stat = stats.Stat(name='inplace', fct=inplace)
+        for context in (self.curveContext,
+                        self.imageContext,
+                        self.scatterContext):
+            with self.subTest(kind=context.kind):
+                self.assertFalse(context.values.flags.writeable)
+                self.assertRaises(ValueError, stat.calculate, context)
+
+    @unittest.skipUnless(test_options.WITH_GL_TEST,
+                         test_options.WITH_GL_TEST_REASON)
+    def testReadOnlyValues3D(self):
+        """Test that statistics cannot modify the data of plot3d items"""
+        def inplace(data):
+            data.sort()
+
+        stat = stats.Stat(name='inplace', fct=inplace)
+        sceneWidget = SceneWidget()
+        try:
+            scatter = sceneWidget.add3DScatter(
+                *numpy.random.random(40).reshape(4, -1))
+            volume = sceneWidget.addVolume(
+                numpy.random.random(27).reshape(3, 3, 3).astype(numpy.float32))
+            scatterContext = stats._plot3DScatterContext(
+                item=scatter, plot=sceneWidget, onlimits=False, roi=None)
+            volumeContext = stats._plot3DArrayContext(
+                item=volume, plot=sceneWidget, onlimits=False, roi=None)
+
+            for context in (scatterContext, volumeContext):
+                with self.subTest(kind=context.kind):
+                    self.assertFalse(context.values.flags.writeable)
+                    self.assertRaises(ValueError, stat.calculate, context)
+        finally:
+            sceneWidget.setAttribute(qt.Qt.WA_DeleteOnClose)
+            sceneWidget.close()
+
     def testStatsImageAdv(self):
         """Test that scale and origin are taking into account for images"""
 
@@ -490,6 +544,47 @@ class TestStatsWidgetWithCurves(TestCaseQt, ParametricTestCase):
         tableItems = self.statsTable._itemToTableItems(curve)
         self.assertEqual(tableItems['max'].text(), '3')
 
+    def testStatsCache(self):
+        """Make sure stats are only recomputed when needed"""
+        curve = self.plot.getCurve('curve0')
+        self.qapp.processEvents()
+        cached = self.statsTable._statsCache[curve]
+
+        curve.setZValue(5)
+        self.qapp.processEvents()
+        self.assertIs(self.statsTable._statsCache[curve], cached)
+
+        curve.setData(x=range(4), y=range(4))
+        self.qapp.processEvents()
+        self.assertIsNot(self.statsTable._statsCache[curve], cached)
+        tableItems = self.statsTable._itemToTableItems(curve)
+        self.assertEqual(tableItems['max'].text(), '3')
+
+    def testUpdateOffscreenRows(self):
+        """Make sure rows out of the viewport are updated when idle"""
+        for index in range(3, 40):
+            self.plot.addCurve(x=range(20), y=range(20),
+                               legend='curve%d' % index)
+        self.widget.resize(300, 150)
+        self.widget.show()
+        self.qWaitForWindowExposed(self.widget)
+
+        self.statsTable._updateAllStats()
+        self.assertTrue(len(self.statsTable._pendingItems) > 0)
+        self.qWait(200)
+        self.assertEqual(len(self.statsTable._pendingItems), 0)
+
+        curve = self.plot.getCurve('curve39')
+        tableItems = self.statsTable._itemToTableItems(curve)
+        self.assertEqual(tableItems['max'].text(), '19')
+
+        # Pending rows are dropped when switching to manual mode
+        self.statsTable._updateAllStats()
+        self.assertTrue(len(self.statsTable._pendingItems) > 0)
+        self.statsTable.setUpdateMode(StatsWidget.UpdateMode.MANUAL)
+        self.assertEqual(len(self.statsTable._pendingItems), 0)
+        self.assertFalse(self.statsTable._pendingStatsTimer.isActive())
+
     def testSetAnotherPlot(self):
         plot2 = Plot1D()
         plot2.addCurve(x=range(26), y=range(26), legend='new curve')
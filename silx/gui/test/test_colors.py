@@ -390,6 +390,22 @@ class TestObjectAPI(ParametricTestCase):
             colors,
             ((0, 0, 0, 255), (255, 255, 255, 255)))))
 
+        # Sampling with the same number of colors as the LUT
+        colormap = Colormap(name='viridis')
+        colors = colormap.getNColors(nbColors=256)
+        self.assertTrue(numpy.array_equal(colors, colormap.getNColors()))
+
+        # Sampling matches applying a linear colormap to a regular ramp
+        for nbColors in (1, 2, 7, 100, 1000):
+            with self.subTest(nbColors=nbColors):
+                reference = Colormap(name='viridis',
+                                     normalization=Colormap.LINEAR,
+                                     vmin=0,
+                                     vmax=nbColors - 1)
+                expected = reference.applyToData(numpy.arange(nbColors))
+                self.assertTrue(numpy.array_equal(
+                    colormap.getNColors(nbColors=nbColors), expected))
+
     def testEditableMode(self):
         """Make sure the colormap will raise NotEditableError when try to
         change a colormap not editable"""
@@ -589,6 +605,9 @@ class TestAutoscaleRange(ParametricTestCase):
             # With negative
             (Colormap.LOGARITHM, Colormap.MINMAX, numpy.array([10, 50, 100, -50]), (10, 100)),
             (Colormap.LOGARITHM, Colormap.STDDEV3, numpy.array([10, 100, -10]), (10, 100)),
+            (Colormap.SQRT, Colormap.MINMAX, numpy.array([10, 50, 100, -50]), (10, 100)),
+            (Colormap.SQRT, Colormap.MINMAX, numpy.array([0, 50, 100, -50]), (0, 100)),
+            (Colormap.SQRT, Colormap.MINMAX, numpy.array([-10, -50]), (0, 1)),
         ]
         for norm, mode, array, expectedRange in data:
             with self.subTest(norm=norm, mode=mode, array=array):